@@ -1,16 +1,34 @@
-from typing import Any
+import re
+import threading
+from typing import Any, Iterator
 
+from cachetools import TTLCache
 from fastapi import HTTPException, status
-from fuzzywuzzy import fuzz
+from psycopg2 import errors
 from pydantic import BaseModel
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from rapidfuzz import fuzz, process, utils
+from sqlalchemy import delete, exists, func, inspect, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy.orm.util import identity_key
 
 from .db import Base
 
 from . import models, schemas
 from security import hashing
 
+_TAG_RE = re.compile(r'[\w.-]*[^\W_][\w.-]*')
+_DEFERRED_JOIN_SKIP = 1000
+_role_ids = TTLCache(maxsize=256, ttl=60)
+_role_ids_lock = threading.Lock()
+_RATING_TABLES = {
+    schemas.ArticleRatingType.likes: (models.users_like_article, models.users_dislike_article),
+    schemas.ArticleRatingType.dislikes: (models.users_dislike_article, models.users_like_article),
+}
+
+NOTIFICATION_COLUMNS = tuple(getattr(models.Notification, field) for field in schemas.Notification.model_fields)
+
 
 def get_object(cls: type, db: Session, object_id: int) -> Base:
     """Returns a `cls` object by `object_id`.
@@ -27,7 +45,7 @@ def get_object(cls: type, db: Session, object_id: int) -> Base:
         `Base`: `Base` model object.
     """
 
-    db_object = db.query(cls).get(object_id)
+    db_object = db.get(cls, object_id)
 
     if not db_object:
         raise HTTPException(
@@ -38,7 +56,32 @@ def get_object(cls: type, db: Session, object_id: int) -> Base:
     return db_object
 
 
-def get_object_by_expression(cls: type, db: Session, expression: Any, raise_404: bool = False) -> Base:
+def object_exists(cls: type, db: Session, object_id: int) -> bool:
+    """Checks if a `cls` object with `object_id` exists without loading it.
+    Objects already loaded in `db` are answered from its identity map.
+
+    Args:
+        `cls` (type): Type of the object to check.
+        `db` (Session): Database connection.
+        `object_id` (int): Object's id.
+
+    Returns:
+        `bool`: True if the object exists, otherwise False.
+    """
+
+    obj = db.identity_map.get(identity_key(cls, object_id))
+    if obj is not None and not (state := inspect(obj)).deleted and not state.was_deleted:
+        return True
+    return db.query(exists().where(cls.id == object_id)).scalar()
+
+
+def get_object_by_expression(
+        cls: type,
+        db: Session,
+        expression: Any,
+        raise_404: bool = False,
+        options: tuple = ()
+) -> Base:
     """Returns `cls` model object filtered by `expression`.
 
     Args:
@@ -46,12 +89,13 @@ def get_object_by_expression(cls: type, db: Session, expression: Any, raise_404:
         `db` (Session): Database connection.
         `expression` (Any): Expression to filter function.
         `raise_404` (bool): To raise error 404 or not. Defaults to False.
+        `options` (tuple, optional): Loader options, e.g. `joinedload(...)`. Defaults to ().
 
     Returns:
         `Base`: `Base` model object.
 
     """
-    obj = db.query(cls).filter(expression).first()
+    obj = db.execute(select(cls).options(*options).where(expression)).scalars().first()
 
     if raise_404 and not obj:
         raise HTTPException(
@@ -62,6 +106,46 @@ def get_object_by_expression(cls: type, db: Session, expression: Any, raise_404:
     return obj
 
 
+def delete_if_owner(
+        cls: type, db: Session, object_id: int, user_id: int, is_admin: bool, owner_column: str = 'author_id'
+) -> bool:
+    """Deletes a `cls` object with `object_id` in a single statement if it belongs to `user_id`
+    or the user is an admin.
+
+    Args:
+        `cls` (type): Type of the object to delete.
+        `db` (Session): Database connection.
+        `object_id` (int): Object's id.
+        `user_id` (int): Id of the user requesting the deletion.
+        `is_admin` (bool): Whether the user is an admin.
+        `owner_column` (str, optional): Name of the column holding the owner's id. Defaults to 'author_id'.
+
+    Raises:
+        `HTTPException`: If object with this id does not exist.
+
+    Returns:
+        `bool`: True if the object was deleted, False if it belongs to another user.
+    """
+
+    statement = delete(cls).where(cls.id == object_id).execution_options(synchronize_session=False)
+    if not is_admin:
+        statement = statement.where(getattr(cls, owner_column) == user_id)
+
+    if db.execute(statement).rowcount:
+        # The bulk DELETE doesn't touch the session, so drop a loaded copy of the row by hand.
+        if (obj := db.identity_map.get(identity_key(cls, object_id))) is not None:
+            db.expunge(obj)
+        db.commit()
+        return True
+
+    if not object_exists(cls=cls, db=db, object_id=object_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'{cls.__name__.capitalize()} with this id does not exist.'
+        )
+    return False
+
+
 def get_objects_by_expression(cls: type, db: Session, expression: Any) -> list[Base]:
     """Returns list of `cls` model objects filtered by `expression`.
 
@@ -75,10 +159,12 @@ def get_objects_by_expression(cls: type, db: Session, expression: Any) -> list[B
 
     """
 
-    return db.query(cls).filter(expression).all()
+    return db.execute(select(cls).where(expression)).scalars().all()
 
 
-def get_objects(cls: type, db: Session, skip: int = 0, limit: int = 100, order_by: any = None) -> list[Base]:
+def get_objects(
+        cls: type, db: Session, skip: int = 0, limit: int = 100, order_by: any = None, options: tuple = ()
+) -> list[Base]:
     """Returns all `Base` objects in range[`skip`:`skip+limit`].
 
     Args:
@@ -86,14 +172,63 @@ def get_objects(cls: type, db: Session, skip: int = 0, limit: int = 100, order_b
         `db` (Session): Database connection.
         `skip` (int, optional): Integer number of how many users you need to skip. Defaults to 0.
         `limit` (int, optional): Integer maximum number of how many users you need to get. Defaults to 100.
+        `order_by` (any, optional): Ordering clause. Defaults to None.
+        `options` (tuple, optional): Loader options applied to the query. Defaults to ().
 
     Returns:
         `list[Base]`: All `Base` model objects.
     """
 
-    if order_by is not None:
-        return db.query(cls).order_by(order_by).offset(skip).limit(limit).all()
-    return db.query(cls).offset(skip).limit(limit).all()
+    # Both paths order the same way, so pages stay consistent across the threshold.
+    ordering = (cls.id,) if order_by is None else (order_by, cls.id)
+    if skip > _DEFERRED_JOIN_SKIP:
+        # Deferred join: walk the skipped rows through the index on ids only
+        # and fetch full rows for the `limit` ids that are left.
+        page = select(cls.id).order_by(*ordering).offset(skip).limit(limit).subquery()
+        statement = select(cls).join(page, cls.id == page.c.id).options(*options).order_by(*ordering)
+        return db.execute(statement).scalars().all()
+
+    statement = select(cls).options(*options).order_by(*ordering).offset(skip).limit(limit)
+    return db.execute(statement).scalars().all()
+
+
+def get_objects_after(
+        cls: type,
+        db: Session,
+        after: int | None = None,
+        limit: int = 100,
+        descending: bool = False,
+        expression: Any = None,
+        options: tuple = (),
+        columns: tuple = ()
+) -> list[Base] | list[dict]:
+    """Returns up to `limit` `cls` objects that follow the object with id `after` in id order.
+    If `columns` are given, returns `dict` rows of these columns instead of objects.
+
+    Args:
+        `cls` (type): Type of the objects to get.
+        `db` (Session): Database connection.
+        `after` (int | None, optional): Id of the last object on the previous page. Defaults to None.
+        `limit` (int, optional): Maximum amount of objects. Defaults to 100.
+        `descending` (bool, optional): To walk ids from newest to oldest. Defaults to False.
+        `expression` (Any, optional): Additional filter expression. Defaults to None.
+        `options` (tuple, optional): Loader options applied to the query. Defaults to ().
+        `columns` (tuple, optional): Columns to select instead of whole objects. Defaults to ().
+
+    Returns:
+        `list[Base] | list[dict]`: `Base` model objects or `dict` rows.
+    """
+
+    statement = select(*columns) if columns else select(cls).options(*options)
+    if expression is not None:
+        statement = statement.where(expression)
+    if after is not None:
+        statement = statement.where(cls.id < after if descending else cls.id > after)
+
+    statement = statement.order_by(cls.id.desc() if descending else cls.id).limit(limit)
+    if columns:
+        return [dict(row) for row in db.execute(statement).mappings()]
+    return db.execute(statement).scalars().all()
 
 
 def delete_object(cls: type, db: Session, object_id: int) -> None:
@@ -124,19 +259,48 @@ def update_object(cls: type, db: Session, object_id: int, schema_object: BaseMod
         `object_id` (int): Object's id.
         `schema_object` (BaseModel): Pydantic object schema.
 
+    Raises:
+        `HTTPException`: If object with this id does not exist.
+
     Returns:
         `Base`: Updated `cls` object.
     """
 
-    db_object = get_object(cls=cls, db=db, object_id=object_id)
-    object_schema = schema_object.__class__(**db_object.__dict__)
+    update_data = schema_object.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_object(cls=cls, db=db, object_id=object_id)
+
+    return _update_returning(cls=cls, db=db, object_id=object_id, values=update_data)
+
+
+def _update_returning(cls: type, db: Session, object_id: int, values: dict) -> Base:
+    """Runs `UPDATE ... RETURNING` for `cls` object with `object_id` and loads the updated row.
+
+    Args:
+        `cls` (type): Type of object model
+        `db` (Session): Database connection.
+        `object_id` (int): Object's id.
+        `values` (dict): Column values or SQL expressions to set.
 
-    update_obj = schema_object.dict(exclude_unset=True)
-    updated_obj = object_schema.copy(update=update_obj)
+    Raises:
+        `HTTPException`: If object with this id does not exist.
+
+    Returns:
+        `Base`: Updated `cls` object.
+    """
+
+    statement = update(cls).where(cls.id == object_id).values(**values).returning(*cls.__table__.columns)
+    db_object = db.execute(
+        select(cls).from_statement(statement).execution_options(populate_existing=True)
+    ).scalar_one_or_none()
+
+    if not db_object:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'{cls.__name__.capitalize()} with this id does not exist.'
+        )
 
-    db.query(cls).filter_by(id=object_id).update(updated_obj.__dict__)
     db.commit()
-    db.refresh(db_object)
 
     return db_object
 
@@ -164,7 +328,6 @@ def create_role(db: Session, role: schemas.RoleCreate) -> models.Role:
     db_role = models.Role(title=role.title)
     db.add(db_role)
     db.commit()
-    db.refresh(db_role)
     return db_role
 
 
@@ -190,7 +353,54 @@ def update_role(db: Session, role_id: int, role: schemas.RoleUpdate) -> models.R
             detail='Role with this title already exists.'
         )
 
-    return update_object(cls=models.Role, db=db, object_id=role_id, schema_object=role)
+    role_db = update_object(cls=models.Role, db=db, object_id=role_id, schema_object=role)
+    with _role_ids_lock:
+        _role_ids.clear()
+    return role_db
+
+
+def get_role_id_by_title(db: Session, title: str) -> int:
+    """Returns the id of a `Role` with `title`, remembering it for a minute.
+
+    The id may be stale on other workers for that minute, so it's only for reads.
+    Writes by title go through `_lock_role_by_title`.
+
+    Args:
+        `db` (Session): Database connection.
+        `title` (str): The `title` of role.
+
+    Raises:
+        `HTTPException`: If there's no role with this `title`.
+
+    Returns:
+        `int`: `Role` object's id.
+    """
+
+    with _role_ids_lock:
+        role_id = _role_ids.get(title)
+    if role_id is not None:
+        return role_id
+
+    role_id = db.execute(select(models.Role.id).where(models.Role.title == title)).scalar()
+    if role_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Role with this field does not exist.'
+        )
+
+    with _role_ids_lock:
+        _role_ids[title] = role_id
+    return role_id
+
+
+def _lock_role_by_title(db: Session, title: str) -> models.Role:
+    role = db.execute(select(models.Role).where(models.Role.title == title).with_for_update()).scalars().first()
+    if role is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Role with this field does not exist.'
+        )
+    return role
 
 
 def update_role_by_title(db: Session, role_title: str, role: schemas.RoleUpdate) -> models.Role:
@@ -205,9 +415,7 @@ def update_role_by_title(db: Session, role_title: str, role: schemas.RoleUpdate)
         `models.Role`: Updated `Role` object.
     """
 
-    role_db = \
-        get_object_by_expression(cls=models.Role, db=db, expression=(models.Role.title == role_title), raise_404=True)
-    return update_role(db=db, role_id=role_db.id, role=role)
+    return update_role(db=db, role_id=_lock_role_by_title(db=db, title=role_title).id, role=role)
 
 
 def delete_role_by_title(db: Session, title: str) -> None:
@@ -221,10 +429,25 @@ def delete_role_by_title(db: Session, title: str) -> None:
         `None`
     """
 
-    role = get_object_by_expression(cls=models.Role, db=db, expression=(models.Role.title == title), raise_404=True)
+    delete_role(db=db, role_id=_lock_role_by_title(db=db, title=title).id)
 
-    db.delete(role)
-    db.commit()
+    return None
+
+
+def delete_role(db: Session, role_id: int) -> None:
+    """Deletes a `Role` object by a given `role_id`.
+
+    Args:
+        `db` (Session): Database connection.
+        `role_id` (int): `Role` object's id.
+
+    Returns:
+        `None`
+    """
+
+    delete_object(cls=models.Role, db=db, object_id=role_id)
+    with _role_ids_lock:
+        _role_ids.clear()
 
     return None
 
@@ -244,15 +467,6 @@ def create_user(db: Session, user: schemas.UserCreate) -> models.User:
         `models.User`: A new `User`.
     """
 
-    if db.query(models.User).filter(
-        or_(models.User.username == user.username, models.User.email == user.email)).first():
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="User with this username or email already exists."
-        )
-
-    get_object(cls=models.Role, db=db, object_id=user.role_id)
-
     hashed_password = hashing.get_password_hash(user.password)
     db_user = models.User(
         username=user.username,
@@ -261,8 +475,21 @@ def create_user(db: Session, user: schemas.UserCreate) -> models.User:
         role_id=user.role_id
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if isinstance(e.orig, errors.ForeignKeyViolation):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail='Role with this id does not exist.'
+            )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User with this username or email already exists."
+        )
+
     return db_user
 
 
@@ -281,9 +508,6 @@ def update_user(db: Session, user_id: int, user: schemas.UserUpdate) -> models.U
         `models.User`: Updated `User` object.
     """
 
-    db_user = get_object(cls=models.User, db=db, object_id=user_id)
-    user_schema = schemas.UserUpdate(**db_user.__dict__)
-
     if user.email\
         and (u := get_object_by_expression(cls=models.User, db=db, expression=(models.User.email == user.email)))\
         and u.id != user_id:
@@ -295,14 +519,7 @@ def update_user(db: Session, user_id: int, user: schemas.UserUpdate) -> models.U
     if user.password:
         user.password = hashing.get_password_hash(user.password)
 
-    update_data = user.dict(exclude_unset=True)
-    updated_user = user_schema.copy(update=update_data)
-
-    db.query(models.User).filter_by(id=user_id).update(updated_user.__dict__)
-    db.commit()
-    db.refresh(db_user)
-
-    return db_user
+    return update_object(cls=models.User, db=db, object_id=user_id, schema_object=user)
 
 
 def create_notification(db: Session, notification: schemas.NotificationCreate) -> models.Notification:
@@ -320,8 +537,17 @@ def create_notification(db: Session, notification: schemas.NotificationCreate) -
         models.Notification: A new `Notification` objects.
     """
 
-    get_object(cls=models.User, db=db, object_id=notification.user_id)
-    get_object(cls=models.Question, db=db, object_id=notification.question_id)
+    if not object_exists(cls=models.User, db=db, object_id=notification.user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='User with this id does not exist.'
+        )
+
+    if not object_exists(cls=models.Question, db=db, object_id=notification.question_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Question with this id does not exist.'
+        )
 
     notification_db = models.Notification(
         title=notification.title,
@@ -331,34 +557,53 @@ def create_notification(db: Session, notification: schemas.NotificationCreate) -
 
     db.add(notification_db)
     db.commit()
-    db.refresh(notification_db)
     return notification_db
 
 
-def get_notifications_by_user_id(db: Session, user_id: int, skip: int, limit: int) -> list[models.Notification]:
-    """Returns notifications by a given `user_id`.
+def get_notifications_by_user_id(
+        db: Session, user_id: int, skip: int, limit: int, after: int | None = None, check_user: bool = True
+) -> list[dict]:
+    """Returns notifications by a given `user_id`, newest first, as `dict` rows shaped like `schemas.Notification`.
+
+    The user is only looked up if there are no notifications to return.
 
     Args:
         `db` (Session): Database connection.
         `user_id` (int): `User` object id.
-        `skip` (int): How many objects to skip.
+        `skip` (int): How many objects to skip. Ignored if `after` is given.
         `limit` (int): Maximum amout of objects.
+        `after` (int | None, optional): Id of the last notification on the previous page. Defaults to None.
+        `check_user` (bool, optional): To check that the user exists. Defaults to True.
 
     Raises:
         `HTTPException`: If there's no user with this `user_id`.
 
     Returns:
-        `list[models.Notification]`: A list of `Notification` objects.
+        `list[dict]`: A list of notification rows.
     """
 
-    if not get_object(models.User, db=db, object_id=user_id):
+    if after is not None or not skip:
+        notifications = get_objects_after(
+            cls=models.Notification,
+            db=db,
+            after=after,
+            limit=limit,
+            descending=True,
+            expression=(models.Notification.user_id == user_id),
+            columns=NOTIFICATION_COLUMNS
+        )
+    else:
+        statement = select(*NOTIFICATION_COLUMNS).where(models.Notification.user_id == user_id)\
+            .order_by(models.Notification.id.desc()).offset(skip).limit(limit)
+        notifications = [dict(row) for row in db.execute(statement).mappings()]
+
+    if not notifications and check_user and not object_exists(cls=models.User, db=db, object_id=user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User with this id does not exist."
         )
 
-    return db.query(models.Notification).order_by(models.Notification.id.desc())\
-        .filter_by(user_id=user_id).offset(skip).limit(limit).all()
+    return notifications
 
 
 def delete_notifications_by_user_id(db: Session, user_id: int) -> None:
@@ -375,7 +620,7 @@ def delete_notifications_by_user_id(db: Session, user_id: int) -> None:
         `None`
     """
 
-    if not get_object(models.User, db=db, object_id=user_id):
+    if not object_exists(cls=models.User, db=db, object_id=user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User with this id does not exist."
@@ -435,9 +680,46 @@ def update_tag(db: Session, tag_id: int, tag: schemas.TagUpdate) -> models.Tag:
             detail='Tag with this title already exists.'
         )
 
+    touch_questions_with_tag(db=db, tag_id=tag_id)
     return update_object(cls=models.Tag, db=db, object_id=tag_id, schema_object=tag)
 
 
+def delete_tag(db: Session, tag_id: int) -> None:
+    """Deletes a `Tag` object by a given `tag_id`.
+
+    Args:
+        `db` (Session): Database connection.
+        `tag_id` (int): `Tag` object's id.
+
+    Returns:
+        `None`
+    """
+
+    touch_questions_with_tag(db=db, tag_id=tag_id)
+    delete_object(cls=models.Tag, db=db, object_id=tag_id)
+
+
+def touch_questions_with_tag(db: Session, tag_id: int) -> None:
+    """Bumps `date_updated` of questions tagged with `tag_id`, since they embed the tag.
+
+    Args:
+        `db` (Session): Database connection.
+        `tag_id` (int): `Tag` object's id.
+
+    Returns:
+        `None`
+    """
+
+    db.execute(
+        update(models.Question)
+        .where(models.Question.id.in_(
+            select(models.tag_question.c.question_id).where(models.tag_question.c.tag_id == tag_id)
+        ))
+        .values(date_updated=func.now())
+        .execution_options(synchronize_session=False)
+    )
+
+
 def fill_tags(db: Session, tags: list[str], question_db: models.Question) -> None:
     """Adds `tags` to a given `question_db`.
 
@@ -453,19 +735,20 @@ def fill_tags(db: Session, tags: list[str], question_db: models.Question) -> Non
     if not tags:
         return
 
-    for tag in tags:
-        tag = tag.lower()
-        if not tag.replace('.', '').replace('-', '').replace('_', '').isalnum():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail='Wrong tag title.'
-            )
+    titles = list(dict.fromkeys(tag.lower() for tag in tags))
 
-        if not (tag_db := get_object_by_expression(cls=models.Tag, db=db, expression=(models.Tag.title == tag))):
-            tag_db = models.Tag(title=tag)
-            db.add(tag_db)
+    if not all(_TAG_RE.fullmatch(title) for title in titles):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Wrong tag title.'
+        )
 
-        question_db.tags.append(tag_db)
+    db.execute(
+        insert(models.Tag)
+        .values([{'title': title} for title in titles])
+        .on_conflict_do_nothing(index_elements=[models.Tag.title])
+    )
+    question_db.tags.extend(db.execute(select(models.Tag).where(models.Tag.title.in_(titles))).scalars().all())
 
 
 def create_question(db: Session, question: schemas.QuestionCreate) -> models.Question:
@@ -482,7 +765,11 @@ def create_question(db: Session, question: schemas.QuestionCreate) -> models.Que
         `models.Question`: A `Question` object.
     """
 
-    get_object(cls=models.User, db=db, object_id=question.author_id)
+    if not object_exists(cls=models.User, db=db, object_id=question.author_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='User with this id does not exist.'
+        )
 
     question_db = models.Question(
         title=question.title,
@@ -495,32 +782,57 @@ def create_question(db: Session, question: schemas.QuestionCreate) -> models.Que
     fill_tags(db=db, tags=question.tags, question_db=question_db)
 
     db.commit()
-    db.refresh(question_db)
     return question_db
 
 
-def get_questions_by_title(db: Session, title: str) -> list[models.Question]:
-    """Seeks for fuzzy equal question title to `title`.
+def get_questions_by_title(db: Session, title: str, limit: int = 50) -> list[models.Question]:
+    """Seeks for fuzzy equal question titles to `title` using trigram similarity.
+    Falls back to scoring titles with RapidFuzz on databases other than PostgreSQL.
 
     Args:
         `db` (Session): Database connection.
         `title` (str): `Question` object's title.
+        `limit` (int, optional): Maximum amount of objects. Defaults to 50.
+
+    Returns:
+        `list[models.Question]`: `Question` objects ordered by similarity.
+    """
+
+    if db.get_bind().dialect.name != 'postgresql':
+        titles = dict(db.execute(select(models.Question.id, models.Question.title)).all())
+        matches = process.extract(
+            title, titles, scorer=fuzz.WRatio, processor=utils.default_process, score_cutoff=60, limit=limit
+        )
+        ids = [question_id for _, _, question_id in matches]
+        statement = select(models.Question).options(selectinload(models.Question.tags)).where(models.Question.id.in_(ids))
+        questions = {q.id: q for q in db.execute(statement).scalars()}
+        return [questions[question_id] for question_id in ids]
+
+    return db.query(models.Question)\
+        .options(selectinload(models.Question.tags))\
+        .filter(models.Question.title.op('%')(title))\
+        .order_by(func.similarity(models.Question.title, title).desc())\
+        .limit(limit).all()
+
+
+def increment_views(db: Session, question_id: int) -> models.Question:
+    """Atomically increments views of a `Question` with `question_id`.
+
+    Args:
+        `db` (Session): Database connection.
+        `question_id` (int): `Question` object's id.
 
     Raises:
-        `HTTPException`: If there's no fuzzy equal question title.
+        `HTTPException`: If question with this id does not exist.
 
     Returns:
-        `models.Question`: `Question` object.
+        `models.Question`: Updated `Question` object.
     """
 
-    questions = sorted(
-        [(question, c) for question in db.query(models.Question).all()
-        if (c := fuzz.WRatio(question.title, title)) >= 60],
-        key=lambda x: x[1], reverse=True
+    return _update_returning(
+        cls=models.Question, db=db, object_id=question_id, values={'views': models.Question.views + 1}
     )
 
-    return [question[0] for question in questions]
-
 
 def update_question(db: Session, question_id: int, question: schemas.QuestionUpdate) -> models.Question:
     """Updates `Question` object by given `question_id` and `question` schema.
@@ -535,19 +847,16 @@ def update_question(db: Session, question_id: int, question: schemas.QuestionUpd
     """
 
     question_db = get_object(cls=models.Question, db=db, object_id=question_id)
-    question_schema = schemas.QuestionUpdate(**question_db.__dict__)
-
-    upd_question = question.dict(exclude_unset=True, exclude={'tags'})
-    updated_question = question_schema.copy(update=upd_question, exclude={'tags'})
 
-    db.query(models.Question).filter_by(id=question_id).update(updated_question.__dict__)
+    for field, value in question.model_dump(exclude_unset=True, exclude={'tags'}).items():
+        setattr(question_db, field, value)
 
     if question.tags:
         question_db.tags = []
         fill_tags(db=db, tags=question.tags, question_db=question_db)
+        question_db.date_updated = func.now()
 
     db.commit()
-    db.refresh(question_db)
 
     return question_db
 
@@ -566,12 +875,8 @@ def create_comment(db: Session, comment: schemas.CommentCreate) -> models.Commen
         `models.Comment`: `Comment` object.
     """
 
-    if not get_object(cls=models.User, db=db, object_id=comment.author_id)\
-            or not get_object(cls=models.Question, db=db, object_id=comment.question_id):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail='User or question with this id does not exist.'
-        )
+    author_db = get_object(cls=models.User, db=db, object_id=comment.author_id)
+    question_db = get_object(cls=models.Question, db=db, object_id=comment.question_id)
 
     comment_db = models.Comment(
         content=comment.content,
@@ -580,36 +885,65 @@ def create_comment(db: Session, comment: schemas.CommentCreate) -> models.Commen
     )
 
     db.add(comment_db)
+
+    if comment.author_id != question_db.author_id:
+        db.add(models.Notification(
+            title=f'User {author_db.username} commented your question: "{question_db.title}".',
+            user_id=question_db.author_id,
+            question_id=question_db.id
+        ))
+
     db.commit()
 
-    if comment.author_id != comment_db.question.author.id:
-        create_notification(
-            db=db,
-            notification=schemas.NotificationCreate(
-                title=f'User {comment_db.author.username} commented your question: "{comment_db.question.title}".',
-                user_id=comment_db.question.author.id,
-                question_id=comment_db.question_id
-            )
+    return comment_db
+
+
+def get_comment_for_auth(db: Session, comment_id: int) -> models.Comment:
+    """Returns a `Comment` by `comment_id` with its question loaded in the same query.
+
+    Args:
+        `db` (Session): Database connection.
+        `comment_id` (int): `Comment` object's id.
+
+    Raises:
+        `HTTPException`: If comment with this id does not exist.
+
+    Returns:
+        `models.Comment`: `Comment` object.
+    """
+
+    comment_db = get_object_by_expression(
+        cls=models.Comment,
+        db=db,
+        expression=(models.Comment.id == comment_id),
+        options=(joinedload(models.Comment.question),)
+    )
+
+    if not comment_db:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Comment with this id does not exist.'
         )
 
     return comment_db
 
 
-def get_comments_by_question_id(db: Session, question_id: int) -> list[models.Comment]:
-    """Returns all comments with `question_id`.
+def get_comments_by_question_id(db: Session, question_id: int) -> Iterator[models.Comment]:
+    """Returns all comments with `question_id`, fetched from a server-side cursor in batches.
 
     Args:
         `db` (Session): Database connection.
         `question_id` (int): `Question` object's id..
 
     Returns:
-        `list[models.Comment]`: List of `Comment` objects.
+        `Iterator[models.Comment]`: Iterator of `Comment` objects.
     """
 
-    comments = db.query(models.Comment)\
+    return db.query(models.Comment)\
+        .options(raiseload('*'))\
         .order_by(models.Comment.date_created.asc())\
-        .filter_by(question_id=question_id).all()
-    return comments
+        .filter_by(question_id=question_id)\
+        .yield_per(200)
 
 
 def create_article(db: Session, article: schemas.ArticleCreate) -> models.Article:
@@ -645,22 +979,19 @@ def update_article_rating(db: Session, article_id: int, user: schemas.User, rati
     """
 
     article_db = get_object(cls=models.Article, db=db, object_id=article_id)
-    user_db = get_object(cls=models.User, db=db, object_id=user.id)
-
-    data_main = getattr(article_db, rating_type)
-
-    if user_db in data_main:
-        data_main.pop(data_main.index(user_db))
-        setattr(article_db, rating_type, data_main)
-    elif user_db not in data_main:
-        data_main.append(user_db)
-        setattr(article_db, rating_type, data_main)
-        names = schemas.ArticleRatingType._member_names_
-        data_secondary = getattr(article_db, names[names.index(rating_type) - 1])
-        if user_db in data_secondary:
-            data_secondary.pop(data_secondary.index(user_db))
-            setattr(article_db, names[names.index(rating_type) - 1], data_secondary)
+    rating_table, opposite_table = _RATING_TABLES[rating_type]
+
+    removed = db.execute(
+        delete(rating_table)
+        .where(rating_table.c.user_id == user.id, rating_table.c.article_id == article_id)
+    ).rowcount
+
+    if not removed:
+        db.execute(insert(rating_table).values(user_id=user.id, article_id=article_id).on_conflict_do_nothing())
+        db.execute(
+            delete(opposite_table)
+            .where(opposite_table.c.user_id == user.id, opposite_table.c.article_id == article_id)
+        )
 
     db.commit()
-    db.refresh(article_db)
     return article_db
@@ -1,7 +1,5 @@
-import datetime
-
-from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Table, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Table, Boolean, Index, func
+from sqlalchemy.orm import backref, configure_mappers, relationship
 
 from .db import Base
 
@@ -30,7 +28,7 @@ class Role(Base):
     id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False, unique=True)
 
-    users = relationship('User', backref='role', cascade='all,delete')
+    users = relationship('User', backref=backref('role', lazy='joined'), cascade='all,delete')
 
     def __repr__(self) -> str:
         return f'Role("{self.title}")'
@@ -38,12 +36,13 @@ class Role(Base):
 
 class User(Base):
     __tablename__ = 'users'
+    __mapper_args__ = {'eager_defaults': True}
 
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String, nullable=False, unique=True, index=True)
     email = Column(String, nullable=False, unique=True, index=True)
     password = Column(String, nullable=False)
-    date_created = Column(DateTime, nullable=False, default=datetime.datetime.now)
+    date_created = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     profile_image = Column(String, nullable=False, default='https://i.imgur.com/2VVImvn.jpg')
     role_id = Column(Integer, ForeignKey('roles.id'))
 
@@ -61,7 +60,11 @@ class Notification(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     user_id = Column(Integer, ForeignKey('users.id'))
-    question_id = Column(Integer, ForeignKey('questions.id'))
+    question_id = Column(Integer, ForeignKey('questions.id', ondelete='CASCADE'))
+
+    __table_args__ = (
+        Index('ix_notifications_user_id_id_desc', user_id, id.desc()),
+    )
 
     def __repr__(self) -> str:
         return f'Notification("{self.user.username}", "{self.question.title}")'
@@ -81,16 +84,21 @@ class Tag(Base):
 
 class Question(Base):
     __tablename__ = 'questions'
+    __mapper_args__ = {'eager_defaults': True}
+    __table_args__ = (
+        Index('questions_title_trgm_idx', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     content = Column(String, nullable=False)
-    date_created = Column(DateTime, nullable=False, default=datetime.datetime.now)
+    date_created = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    date_updated = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     views = Column(Integer, nullable=False, default=0)
-    author_id = Column(Integer, ForeignKey('users.id'))
+    author_id = Column(Integer, ForeignKey('users.id'), index=True)
 
-    notifications = relationship('Notification', backref='question', cascade='all,delete')
-    comments = relationship('Comment', backref='question', cascade='all,delete')
+    notifications = relationship('Notification', backref='question', cascade='all,delete', passive_deletes=True)
+    comments = relationship('Comment', backref='question', cascade='all,delete', passive_deletes=True)
 
     def __repr__(self) -> str:
         return f'Question("{self.title}", "{self.author.username}")'
@@ -98,13 +106,18 @@ class Question(Base):
 
 class Comment(Base):
     __tablename__ = 'comments'
+    __mapper_args__ = {'eager_defaults': True}
 
     id = Column(Integer, primary_key=True, index=True)
     content = Column(String, nullable=False)
-    date_created = Column(DateTime, nullable=False, default=datetime.datetime.now)
+    date_created = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     is_answer = Column(Boolean, nullable=False, default=False)
-    author_id = Column(Integer, ForeignKey('users.id'))
-    question_id = Column(Integer, ForeignKey('questions.id'))
+    author_id = Column(Integer, ForeignKey('users.id'), index=True)
+    question_id = Column(Integer, ForeignKey('questions.id', ondelete='CASCADE'))
+
+    __table_args__ = (
+        Index('ix_comments_question_id_date_created', question_id, date_created),
+    )
 
     def __repr__(self) -> str:
         return f'Comment("{self.author.username}", "{self.content[:10]}...")'
@@ -112,13 +125,18 @@ class Comment(Base):
 
 class Article(Base):
     __tablename__ = 'articles'
+    __mapper_args__ = {'eager_defaults': True}
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     content = Column(String, nullable=False)
-    date_created = Column(DateTime, nullable=False, default=datetime.datetime.now)
+    date_created = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     likes = relationship('User', secondary=users_like_article, backref='likes')
     dislikes = relationship('User', secondary=users_dislike_article, backref='dislikes')
 
     def __repr__(self) -> str:
         return f'Article("{self.title}")'
+
+
+# Set up backref attributes (e.g. `User.role`) eagerly so they can be used in loader options.
+configure_mappers()
@@ -1,20 +1,14 @@
 import datetime
 from enum import Enum
-from typing import ForwardRef, List, Optional
+from typing import Optional
 
-from pydantic import BaseModel, EmailStr
-
-User = ForwardRef('User')
-Notification = ForwardRef('Notification')
-Question = ForwardRef('Question')
-Comment = ForwardRef('Comment')
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 class RoleBase(BaseModel):
     title: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RoleCreate(RoleBase):
@@ -27,10 +21,9 @@ class RoleUpdate(BaseModel):
 
 class Role(RoleBase):
     id: int
-    users: list[User] = []
+    users: list['User'] = []
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserBase(BaseModel):
@@ -55,8 +48,12 @@ class User(UserBase):
     date_created: datetime.datetime
     profile_image: Optional[str] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CurrentUser(User):
+    role: Optional[RoleBase] = None
+    is_admin: bool = False
 
 
 class NotificationBase(BaseModel):
@@ -76,15 +73,13 @@ class NotificationUpdate(BaseModel):
 class Notification(NotificationBase):
     id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TagBase(BaseModel):
     title: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TagCreate(TagBase):
@@ -97,10 +92,9 @@ class TagUpdate(BaseModel):
 
 class Tag(TagBase):
     id: int
-    questions: list[Question] = []
+    questions: list['Question'] = []
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QuestionBase(BaseModel):
@@ -127,8 +121,7 @@ class Question(QuestionBase):
     views: int
     tags: list[TagBase] = []
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CommentBase(BaseModel):
@@ -151,8 +144,7 @@ class Comment(CommentBase):
     date_created: datetime.datetime
     is_answer: bool
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ArticleBase(BaseModel):
@@ -175,8 +167,7 @@ class Article(ArticleBase):
     likes: list[User]
     dislikes: list[User]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ArticleRatingType(str, Enum):
@@ -184,7 +175,5 @@ class ArticleRatingType(str, Enum):
     dislikes = 'dislikes'
 
 
-Role.update_forward_refs()
-User.update_forward_refs()
-Tag.update_forward_refs()
-Question.update_forward_refs()
+Role.model_rebuild()
+Tag.model_rebuild()
@@ -1,12 +1,20 @@
+import threading
 from functools import wraps
+from typing import Any
 
+from cachetools import TTLCache
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
+
+_response_caches: dict[str, TTLCache] = {}
+_response_cache_lock = threading.Lock()
+_UNCACHED_ARGS = frozenset({'db', 'current_user'})
 
 
 def raise_403_if_not_admin(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        if (user := kwargs.get('current_user')) and user.role.title != 'Admin':
+        if (user := kwargs.get('current_user')) and not user.is_admin:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail='You are not an admin.'
@@ -20,7 +28,7 @@ def raise_403_if_no_access(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
         if (user := kwargs.get('current_user')) \
-                and user.role.title != 'Admin' \
+                and not user.is_admin \
                 and user.id != kwargs.get('user_id'):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -29,3 +37,50 @@ def raise_403_if_no_access(func):
         return func(*args, **kwargs)
 
     return wrapper
+
+
+def cache_response(namespace: str, response_model: Any, ttl: int = 30):
+    """Caches validated responses of a route in `namespace` for `ttl` seconds,
+    keyed by the route's name and its arguments except `db` and `current_user`.
+
+    Args:
+        `namespace` (str): Cache namespace, cleared by `invalidate_cache`.
+        `response_model` (Any): Schema the route's result is validated against.
+        `ttl` (int, optional): Time to live of cached responses in seconds. Defaults to 30.
+    """
+
+    adapter = TypeAdapter(response_model)
+    cache = _response_caches.setdefault(namespace, TTLCache(maxsize=1024, ttl=ttl))
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, tuple(sorted((k, v) for k, v in kwargs.items() if k not in _UNCACHED_ARGS)))
+            with _response_cache_lock:
+                if (response := cache.get(key)) is not None:
+                    return response
+
+            response = adapter.validate_python(func(*args, **kwargs))
+            with _response_cache_lock:
+                cache[key] = response
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_cache(*namespaces: str) -> None:
+    """Drops all cached responses in `namespaces`.
+
+    Args:
+        `namespaces` (str): Cache namespaces to clear.
+
+    Returns:
+        `None`
+    """
+
+    with _response_cache_lock:
+        for namespace in namespaces:
+            if (cache := _response_caches.get(namespace)) is not None:
+                cache.clear()
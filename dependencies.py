@@ -1,11 +1,37 @@
-from fastapi import Depends, HTTPException, status, WebSocket, Query
+import hashlib
+import os
+import threading
+import time
+from typing import Optional
+
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, Response, status, WebSocket, Query
+from fastapi.concurrency import run_in_threadpool
 from jose import jwt, JWTError
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from database.db import SessionLocal
-from database import models
+from database.schemas import CurrentUser
 from security import security_token, schemas
-from services import get_user_by_username_or_email
+from services import get_user_by_id, get_user_by_username_or_email
+
+_DECODE_KWARGS = {'key': security_token.SECRET_KEY, 'algorithms': [security_token.ALGORITHM]}
+_payload_cache = TTLCache(maxsize=10000, ttl=30)
+_user_cache = TTLCache(maxsize=5000, ttl=30)
+_cache_lock = threading.Lock()
+
+REDIS_URL = os.environ.get('REDIS_URL')
+REDIS_TIMEOUT = float(os.environ.get('REDIS_TIMEOUT', 0.5))
+if REDIS_URL:
+    import redis
+
+    _redis = redis.Redis.from_url(REDIS_URL, socket_timeout=REDIS_TIMEOUT, socket_connect_timeout=REDIS_TIMEOUT)
+else:
+    _redis = None
+# As short as the in-process cache: a snapshot written just after an invalidation
+# must not outlive it by more than a few seconds.
+_REDIS_USER_TTL = 30
 
 
 def get_db():
@@ -22,7 +48,113 @@ def get_db():
         db.close()
 
 
-def get_user(user_token: str, db: Session):
+def _token_key(user_token: str) -> str:
+    return hashlib.sha256(user_token.encode()).hexdigest()[:32]
+
+
+def invalidate_user_cache(user_id: Optional[int] = None) -> None:
+    """Drops cached users with `user_id`, or every cached user if it's not given.
+
+    Args:
+        `user_id` (Optional[int], optional): `User` object's id. Defaults to None.
+
+    Returns:
+        `None`
+    """
+
+    with _cache_lock:
+        if user_id is None:
+            _user_cache.clear()
+        else:
+            for key, user in list(_user_cache.items()):
+                if user.id == user_id:
+                    _user_cache.pop(key, None)
+
+    if _redis is None:
+        return
+    try:
+        if user_id is None:
+            keys = [
+                *_redis.scan_iter(match='user:*', count=500),
+                *_redis.scan_iter(match='user-id:*', count=500),
+            ]
+        else:
+            keys = [f'user-id:{user_id}']
+            if (username := _redis.get(keys[0])) is not None:
+                keys.append(f'user:{username.decode()}')
+        if keys:
+            _redis.delete(*keys)
+    except redis.RedisError:
+        pass
+
+
+def _get_shared_user(username: str) -> Optional[CurrentUser]:
+    """Returns the current user with `username` from Redis, if it's configured and has one.
+
+    Args:
+        `username` (str): User's username.
+
+    Returns:
+        `Optional[CurrentUser]`: A snapshot of the user or None.
+    """
+
+    if _redis is None:
+        return None
+    try:
+        cached = _redis.get(f'user:{username}')
+    except redis.RedisError:
+        return None
+    return CurrentUser.model_validate_json(cached) if cached is not None else None
+
+
+def _set_shared_user(username: str, current_user: CurrentUser) -> None:
+    """Stores `current_user` in Redis, if it's configured, so other workers can skip the database.
+
+    Args:
+        `username` (str): Username the user was looked up by.
+        `current_user` (CurrentUser): A snapshot of the user.
+
+    Returns:
+        `None`
+    """
+
+    if _redis is None:
+        return
+    try:
+        with _redis.pipeline() as pipe:
+            pipe.setex(f'user:{username}', _REDIS_USER_TTL, current_user.model_dump_json())
+            pipe.setex(f'user-id:{current_user.id}', _REDIS_USER_TTL, username)
+            pipe.execute()
+    except redis.RedisError:
+        pass
+
+
+def decode_token(user_token: str) -> dict:
+    """Decodes `user_token`, reusing the payload of a recently seen token.
+
+    Args:
+        `user_token` (str): User's token.
+
+    Raises:
+        `JWTError`: If the token is invalid or expired.
+
+    Returns:
+        `dict`: Token payload.
+    """
+
+    key = _token_key(user_token)
+    with _cache_lock:
+        payload = _payload_cache.get(key)
+    if payload is not None and payload.get('exp', 0) > time.time():
+        return payload
+
+    payload = jwt.decode(user_token, **_DECODE_KWARGS)
+    with _cache_lock:
+        _payload_cache[key] = payload
+    return payload
+
+
+def get_user(user_token: str, db: Session) -> CurrentUser:
     """Returns the current user if he passes authentication.
 
     Args:
@@ -35,7 +167,7 @@ def get_user(user_token: str, db: Session):
         `HTTPException`: If there's no user with this username.
 
     Returns:
-        models.User: A current user.
+        `CurrentUser`: A snapshot of the current user.
     """
 
     credentials_exception = HTTPException(
@@ -44,7 +176,7 @@ def get_user(user_token: str, db: Session):
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(user_token, security_token.SECRET_KEY, algorithms=[security_token.ALGORITHM])
+        payload = decode_token(user_token)
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
@@ -52,29 +184,115 @@ def get_user(user_token: str, db: Session):
     except JWTError:
         raise credentials_exception
 
-    user = get_user_by_username_or_email(db=db, username=token_data.username)
+    key = (token_data.username, _token_key(user_token))
+    with _cache_lock:
+        current_user = _user_cache.get(key)
+    if current_user is not None:
+        return current_user
 
-    if user is None:
-        raise credentials_exception
-    return user
+    user_id = payload.get('uid')
+    current_user = _get_shared_user(token_data.username)
+    if current_user is not None and user_id is not None and current_user.id != user_id:
+        # The username now belongs to another account than the one the token was issued for.
+        current_user = None
+    if current_user is None:
+        if user_id is not None:
+            user = get_user_by_id(db=db, user_id=user_id)
+            if user is not None and user.username != token_data.username:
+                user = None
+        else:
+            user = get_user_by_username_or_email(db=db, username=token_data.username)
+
+        if user is None:
+            raise credentials_exception
+
+        current_user = CurrentUser.model_validate(user)
+        current_user.is_admin = user.role is not None and user.role.title == 'Admin'
+        # The request's session is shared with the route, which must not get
+        # this raiseload-guarded instance back from the identity map.
+        db.expunge(user)
+        _set_shared_user(token_data.username, current_user)
+
+    with _cache_lock:
+        _user_cache[key] = current_user
+    return current_user
 
 
 async def get_current_user(
         user_token: str = Depends(security_token.oauth2_scheme),
         db: Session = Depends(get_db)
-) -> models.User:
-    return get_user(user_token, db)
+) -> CurrentUser:
+    return await run_in_threadpool(get_user, user_token, db)
 
 
 async def get_token_in_query(
     websocket: WebSocket,
     token: str = Query(...),
 ):
-    return token.replace('Bearer ', '')
+    return token[7:] if token.startswith('Bearer ') else token
 
 
 async def get_current_user_by_query(
         user_token: str = Depends(get_token_in_query),
         db: Session = Depends(get_db)
-) -> models.User:
-    return get_user(user_token, db)
+) -> CurrentUser:
+    return await run_in_threadpool(get_user, user_token, db)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get('if-none-match', '')
+    return if_none_match == '*' or etag in (tag.strip() for tag in if_none_match.split(','))
+
+
+def json_response_with_etag(request: Request, body: str, cache_control: str = 'no-cache') -> Response:
+    """Returns the serialized `body` with an ETag derived from its hash, or `304 Not Modified`
+    if the client's `If-None-Match` already has it.
+
+    Args:
+        `request` (Request): Incoming request.
+        `body` (str): JSON body of the response.
+        `cache_control` (str, optional): `Cache-Control` header value. Defaults to 'no-cache'.
+
+    Returns:
+        `Response`: JSON or no content response.
+    """
+
+    content = body.encode()
+    etag = f'W/"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+    headers = {'ETag': etag, 'Cache-Control': cache_control}
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type='application/json', headers=headers)
+
+
+def conditional_get(cls: type, id_param: str):
+    """Returns a dependency that answers `304 Not Modified` when the client's `If-None-Match`
+    matches the `cls` object's current ETag, built from its id and `date_updated`.
+
+    The dependency returns the ETag, so a route cached with `cache_response` should take it
+    as an argument: it becomes part of the cache key and a body is never served under a newer ETag.
+
+    Args:
+        `cls` (type): Type of the requested object. Must have a `date_updated` column.
+        `id_param` (str): Name of the path parameter holding the object's id.
+    """
+
+    def dependency(request: Request, response: Response, db: Session = Depends(get_db)) -> Optional[str]:
+        try:
+            object_id = int(request.path_params[id_param])
+        except ValueError:
+            return None
+
+        date_updated = db.execute(select(cls.date_updated).where(cls.id == object_id)).scalar()
+        if date_updated is None:
+            return None
+
+        etag = f'W/"{object_id}-{date_updated.timestamp()}"'
+        if _etag_matches(request, etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+        response.headers['ETag'] = etag
+        response.headers['Cache-Control'] = 'no-cache'
+        return etag
+
+    return dependency
@@ -1,15 +1,28 @@
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm.session import Session
+from fastapi.responses import ORJSONResponse
 
-from database import models
-from database.db import engine, SessionLocal
-from services import isemail
+from database.db import DB_MAX_OVERFLOW, DB_POOL_SIZE, engine, warm_up_pool
 from security import router as security_router
-from security.hashing import get_password_hash
 from routers import router
 
-app = FastAPI(docs_url=None, redoc_url=None)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync routes each hold a pooled connection on a worker thread, so let as
+    # many of them run at once as the pool can serve.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    await run_in_threadpool(warm_up_pool)
+    yield
+    engine.dispose()
+
+
+app = FastAPI(docs_url=None, redoc_url=None, lifespan=lifespan, default_response_class=ORJSONResponse)
 
 origins = [
     "https://observers.gipss.tech",
@@ -24,34 +37,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.include_router(router)
 app.include_router(security_router.router)
-
-
-@app.on_event('startup')
-def startup():
-    models.Base.metadata.create_all(bind=engine)
-    db: Session = SessionLocal()
-    roles = [role.title for role in db.query(models.Role).all()]
-    if not roles:
-        a = models.Role(title='Admin')
-        u = models.Role(title='User')
-        db.add_all([a, u])
-
-    if 'admin' not in [user.username for user in db.query(models.User).all()]:
-        # while not isemail(admin_email := input('Choose admin\'s email: ')):
-        #     print('Wrong email!')
-        # admin_password = get_password_hash(input('Choose admin\'s password: '))
-        admin_email = 'admin@observers.com'
-        admin_password = get_password_hash('admin')
-        admin = models.User(
-            username='admin',
-            email=admin_email,
-            password=admin_password,
-            role_id=1
-        )
-        db.add(admin)
-
-    db.commit()
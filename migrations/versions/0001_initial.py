@@ -0,0 +1,141 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 12:00:00
+
+Matches the tables `create_all` used to build on startup. Databases created that way
+should be marked with `alembic stamp 0001` instead of upgrading through this revision.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'roles',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('title'),
+    )
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('password', sa.String(), nullable=False),
+        sa.Column('date_created', sa.DateTime(), nullable=False),
+        sa.Column('profile_image', sa.String(), nullable=False),
+        sa.Column('role_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['role_id'], ['roles.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_users_id', 'users', ['id'])
+    op.create_index('ix_users_username', 'users', ['username'], unique=True)
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_table(
+        'tags',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('title'),
+    )
+    op.create_index('ix_tags_id', 'tags', ['id'])
+    op.create_table(
+        'questions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('content', sa.String(), nullable=False),
+        sa.Column('date_created', sa.DateTime(), nullable=False),
+        sa.Column('views', sa.Integer(), nullable=False),
+        sa.Column('author_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['author_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_questions_id', 'questions', ['id'])
+    op.create_table(
+        'articles',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('content', sa.String(), nullable=False),
+        sa.Column('date_created', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_articles_id', 'articles', ['id'])
+    op.create_table(
+        'notifications',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('question_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['question_id'], ['questions.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_notifications_id', 'notifications', ['id'])
+    op.create_table(
+        'comments',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('content', sa.String(), nullable=False),
+        sa.Column('date_created', sa.DateTime(), nullable=False),
+        sa.Column('is_answer', sa.Boolean(), nullable=False),
+        sa.Column('author_id', sa.Integer(), nullable=True),
+        sa.Column('question_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['author_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['question_id'], ['questions.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_comments_id', 'comments', ['id'])
+    op.create_table(
+        'tag_question',
+        sa.Column('tag_id', sa.Integer(), nullable=False),
+        sa.Column('question_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['question_id'], ['questions.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('tag_id', 'question_id'),
+    )
+    op.create_index('ix_tag_question_tag_id', 'tag_question', ['tag_id'])
+    op.create_index('ix_tag_question_question_id', 'tag_question', ['question_id'])
+    op.create_table(
+        'users_like_article',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('article_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['article_id'], ['articles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'article_id'),
+    )
+    op.create_index('ix_users_like_article_user_id', 'users_like_article', ['user_id'])
+    op.create_index('ix_users_like_article_article_id', 'users_like_article', ['article_id'])
+    op.create_table(
+        'users_dislike_article',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('article_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['article_id'], ['articles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'article_id'),
+    )
+    op.create_index('ix_users_dislike_article_user_id', 'users_dislike_article', ['user_id'])
+    op.create_index('ix_users_dislike_article_article_id', 'users_dislike_article', ['article_id'])
+
+
+def downgrade() -> None:
+    op.drop_table('users_dislike_article')
+    op.drop_table('users_like_article')
+    op.drop_table('tag_question')
+    op.drop_table('comments')
+    op.drop_table('notifications')
+    op.drop_table('articles')
+    op.drop_table('questions')
+    op.drop_table('tags')
+    op.drop_table('users')
+    op.drop_table('roles')
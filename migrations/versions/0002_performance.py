@@ -0,0 +1,65 @@
+"""Indexes and server-side defaults
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 12:10:00
+
+Trigram title search, foreign key and listing indexes, and `now()` defaults
+for `date_created` stored as `timestamptz`.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DATED_TABLES = ('users', 'questions', 'comments', 'articles')
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'questions_title_trgm_idx',
+        'questions',
+        ['title'],
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+    op.create_index('ix_questions_author_id', 'questions', ['author_id'])
+    op.create_index('ix_comments_author_id', 'comments', ['author_id'])
+    op.create_index('ix_comments_question_id_date_created', 'comments', ['question_id', 'date_created'])
+    op.create_index('ix_notifications_user_id_id_desc', 'notifications', ['user_id', sa.text('id DESC')])
+
+    for table in DATED_TABLES:
+        op.alter_column(
+            table,
+            'date_created',
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.func.now(),
+        )
+
+
+def downgrade() -> None:
+    for table in DATED_TABLES:
+        op.alter_column(
+            table,
+            'date_created',
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=None,
+        )
+
+    op.drop_index('ix_notifications_user_id_id_desc', table_name='notifications')
+    op.drop_index('ix_comments_question_id_date_created', table_name='comments')
+    op.drop_index('ix_comments_author_id', table_name='comments')
+    op.drop_index('ix_questions_author_id', table_name='questions')
+    op.drop_index('questions_title_trgm_idx', table_name='questions')
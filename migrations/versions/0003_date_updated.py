@@ -0,0 +1,30 @@
+"""Track when questions change
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 12:20:00
+
+`date_updated` backs the ETag of the question detail route.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'questions',
+        sa.Column('date_updated', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('questions', 'date_updated')
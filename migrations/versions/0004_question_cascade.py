@@ -0,0 +1,35 @@
+"""Cascade question deletes to comments and notifications in the database
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 12:30:00
+
+Lets questions be removed with a single `DELETE` instead of loading their
+comments and notifications through the ORM cascade first.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+QUESTION_CHILDREN = ('comments', 'notifications')
+
+
+def upgrade() -> None:
+    for table in QUESTION_CHILDREN:
+        op.drop_constraint(f'{table}_question_id_fkey', table, type_='foreignkey')
+        op.create_foreign_key(
+            f'{table}_question_id_fkey', table, 'questions', ['question_id'], ['id'], ondelete='CASCADE'
+        )
+
+
+def downgrade() -> None:
+    for table in QUESTION_CHILDREN:
+        op.drop_constraint(f'{table}_question_id_fkey', table, type_='foreignkey')
+        op.create_foreign_key(f'{table}_question_id_fkey', table, 'questions', ['question_id'], ['id'])
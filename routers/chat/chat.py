@@ -1,8 +1,8 @@
 import datetime
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, Query
 
-from database import models, schemas
+from database import schemas
 from dependencies import get_current_user_by_query
 from .socket_manager import socket_manager
 
@@ -12,22 +12,27 @@ router = APIRouter(prefix='/chat', tags=['chat'])
 @router.websocket('/ws/chat/')
 async def chat(
         websocket: WebSocket,
-        current_user: models.User = Depends(get_current_user_by_query),
+        room: str = Query('general'),
+        current_user: schemas.CurrentUser = Depends(get_current_user_by_query),
 ):
     if current_user:
-        await socket_manager.connect(websocket, current_user)
+        await socket_manager.connect(websocket, current_user, room)
         response = {
             'user': current_user.username,
             'message': 'connected to the chat',
             'connection': True
         }
-        await socket_manager.send(response)
+        await socket_manager.send(room, response)
 
         try:
             while True:
                 data = await websocket.receive_json()
-                await socket_manager.send(data)
+                await socket_manager.send(room, data)
         except WebSocketDisconnect:
-            socket_manager.disconnect(websocket, current_user)
-            response['message'] = 'left the chat'
-            await socket_manager.send(response)
+            pass
+        finally:
+            # Runs on any exit (bad JSON, cancellation, ...) so the writer
+            # task and the room entry never outlive the connection.
+            socket_manager.disconnect(websocket, current_user, room)
+        response['message'] = 'left the chat'
+        await socket_manager.send(room, response)
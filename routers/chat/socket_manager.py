@@ -1,22 +1,69 @@
+import asyncio
+from collections import defaultdict
+
+import orjson
 from fastapi import WebSocket
 
-from database import models
+from database import schemas
+
+MAX_PENDING_MESSAGES = 256
 
 
 class SocketManager:
     def __init__(self):
-        self.active_connections: list[(WebSocket, models.User)] = []
+        self.active_connections: dict[WebSocket, schemas.CurrentUser] = {}
+        self.rooms: dict[str, set[WebSocket]] = defaultdict(set)
+        self.queues: dict[WebSocket, asyncio.Queue] = {}
+        self.writers: dict[WebSocket, asyncio.Task] = {}
+        self.closing: set[asyncio.Task] = set()
 
-    async def connect(self, websocket: WebSocket, user: models.User):
+    async def connect(self, websocket: WebSocket, user: schemas.CurrentUser, room: str):
         await websocket.accept()
-        self.active_connections.append((websocket, user))
+        self.active_connections[websocket] = user
+        self.queues[websocket] = queue = asyncio.Queue(maxsize=MAX_PENDING_MESSAGES)
+        self.writers[websocket] = asyncio.create_task(self._writer(websocket, room, queue))
+        self.join(room, websocket)
+
+    def disconnect(self, websocket: WebSocket, user: schemas.CurrentUser, room: str):
+        self.active_connections.pop(websocket, None)
+        self.queues.pop(websocket, None)
+        if (writer := self.writers.pop(websocket, None)) is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        self.leave(room, websocket)
+
+    def join(self, room: str, websocket: WebSocket):
+        self.rooms[room].add(websocket)
+
+    def leave(self, room: str, websocket: WebSocket):
+        if (sockets := self.rooms.get(room)) is not None:
+            sockets.discard(websocket)
+            if not sockets:
+                del self.rooms[room]
 
-    def disconnect(self, websocket: WebSocket, user: models.User):
-        self.active_connections.remove((websocket, user))
+    async def send(self, room: str, data):
+        payload = orjson.dumps(data).decode()
+        for ws in list(self.rooms.get(room, ())):
+            try:
+                self.queues[ws].put_nowait(payload)
+            except (KeyError, asyncio.QueueFull):
+                # The client can't keep up; drop it rather than buffering without limit.
+                self.disconnect(ws, self.active_connections.get(ws), room)
+                closing = asyncio.create_task(ws.close(code=1013))
+                self.closing.add(closing)
+                closing.add_done_callback(self.closing.discard)
 
-    async def send(self, data):
-        for ws, user in self.active_connections:
-            await ws.send_json(data)
+    async def _writer(self, websocket: WebSocket, room: str, queue: asyncio.Queue):
+        try:
+            while True:
+                payloads = [await queue.get()]
+                while not queue.empty():
+                    payloads.append(queue.get_nowait())
+                for payload in payloads:
+                    await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(websocket, self.active_connections.get(websocket), room)
 
 
 socket_manager = SocketManager()
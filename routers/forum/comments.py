@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, Response, status, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm.session import Session
 
 from database import crud, models, schemas
 from decorators import raise_403_if_not_admin
 from dependencies import get_db, get_current_user
+from services import stream_json_list
 
 router = APIRouter(prefix='/comments', tags=['comments'])
 
@@ -51,18 +53,21 @@ def get_comments(
 
 
 @router.get('/{question_id}/', response_model=list[schemas.Comment])
-def get_comments_by_question(question_id: int, db: Session = Depends(get_db)) -> list[models.Comment]:
-    """Gets all `Comments` with `question_id` from database and returns them to the client.
+def get_comments_by_question(question_id: int, db: Session = Depends(get_db)) -> StreamingResponse:
+    """Streams all `Comments` with `question_id` from database to the client.
 
     Args:
         `question_id` (int): `Question` object's id.
         `db` (Session, optional): Database connection.
 
     Returns:
-        `list[models.Comment]`: List of `Comment` objects.
+        `StreamingResponse`: JSON list of `Comment` objects.
     """
 
-    return crud.get_comments_by_question_id(db=db, question_id=question_id)
+    return StreamingResponse(
+        stream_json_list(crud.get_comments_by_question_id(db=db, question_id=question_id), schemas.Comment),
+        media_type='application/json'
+    )
 
 
 @router.patch('/{comment_id}/', response_model=schemas.Comment)
@@ -79,16 +84,26 @@ def update_comment(
         `comment` (schemas.CommentUpdate): `CommentUpdate` schema.
         `db` (Session, optional): Database connection.
 
+    Raises:
+        `HTTPException`: If current user can't change any of the given fields.
+
     Returns:
         `models.Comment`: `Comment` object.
     """
 
-    if current_user.role.title == 'Admin':
+    if current_user.is_admin:
         return crud.update_object(cls=models.Comment, db=db, object_id=comment_id, schema_object=comment)
 
-    comment_db = crud.get_object(cls=models.Comment, db=db, object_id=comment_id)
+    forbidden_exception = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail='You are not author of comment.'
+    )
+    if not comment.content and comment.is_answer is None:
+        raise forbidden_exception
 
-    if comment.content and current_user.id == comment_db.author.id:
+    comment_db = crud.get_comment_for_auth(db=db, comment_id=comment_id)
+
+    if comment.content and current_user.id == comment_db.author_id:
         return crud.update_object(
             cls=models.Comment,
             db=db,
@@ -96,7 +111,7 @@ def update_comment(
             schema_object=schemas.CommentUpdate(content=comment.content)
         )
 
-    elif comment.is_answer is not None and current_user.id == comment_db.question.author.id:
+    elif comment.is_answer is not None and current_user.id == comment_db.question.author_id:
         return crud.update_object(
             cls=models.Comment,
             db=db,
@@ -104,6 +119,8 @@ def update_comment(
             schema_object=schemas.CommentUpdate(is_answer=comment.is_answer)
         )
 
+    raise forbidden_exception
+
 
 @router.delete('/{comment_id}/')
 def delete_question(
@@ -124,9 +141,13 @@ def delete_question(
         `Response`: No content response.
     """
 
-    if current_user.role.title == 'Admin' or\
-            current_user.id == crud.get_object(cls=models.Comment, db=db, object_id=comment_id).author.id:
-        crud.delete_object(cls=models.Comment, db=db, object_id=comment_id)
+    if crud.delete_if_owner(
+            cls=models.Comment,
+            db=db,
+            object_id=comment_id,
+            user_id=current_user.id,
+            is_admin=current_user.is_admin
+    ):
         return Response(status_code=status.HTTP_204_NO_CONTENT)
     else:
         raise HTTPException(
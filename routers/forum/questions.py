@@ -1,9 +1,11 @@
-from typing import Union
+from typing import Optional, Union
 from fastapi import APIRouter, Depends, Response, status, HTTPException
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.session import Session
 
 from database import crud, models, schemas
-from dependencies import get_db, get_current_user
+from decorators import cache_response, invalidate_cache
+from dependencies import conditional_get, get_db, get_current_user
 
 router = APIRouter(prefix='/questions', tags=['questions'])
 
@@ -27,10 +29,13 @@ def create_question(
     if question.author_id is None:
         question.author_id = current_user.id
 
-    return crud.create_question(db=db, question=question)
+    question_db = crud.create_question(db=db, question=question)
+    invalidate_cache('questions', 'tags')
+    return question_db
 
 
 @router.get('/', response_model=list[schemas.Question])
+@cache_response('questions', list[schemas.Question])
 def get_questions(
         skip: int = 0,
         limit: int = 100,
@@ -56,6 +61,7 @@ def get_questions(
     if by_title:
         return crud.get_questions_by_title(db=db, title=by_title)
 
+    options = (selectinload(models.Question.tags),)
     if order_by_date:
         if order_by_date.lower() == 'desc':
             return crud.get_objects(
@@ -63,7 +69,8 @@ def get_questions(
                 db=db,
                 skip=skip,
                 limit=limit,
-                order_by=models.Question.date_created.desc()
+                order_by=models.Question.date_created.desc(),
+                options=options
             )
         elif order_by_date.lower() == 'asc':
             return crud.get_objects(
@@ -71,7 +78,8 @@ def get_questions(
                 db=db,
                 skip=skip,
                 limit=limit,
-                order_by=models.Question.date_created.asc()
+                order_by=models.Question.date_created.asc(),
+                options=options
             )
     elif order_by_views:
         return crud.get_objects(
@@ -79,22 +87,24 @@ def get_questions(
             db=db,
             skip=skip,
             limit=limit,
-            order_by=models.Question.views.desc()
+            order_by=models.Question.views.desc(),
+            options=options
         )
-    return crud.get_objects(cls=models.Question, db=db, skip=skip, limit=limit)
-
-
-@router.get('/{question_title}/title/', response_model=list[schemas.Question])
-def get_questions_by_title(question_title: str, db: Session = Depends(get_db)) -> list[models.Question]:
-    return crud.get_questions_by_title(db=db, title=question_title)
+    return crud.get_objects(cls=models.Question, db=db, skip=skip, limit=limit, options=options)
 
 
 @router.get('/{question_id}/', response_model=schemas.Question)
-def get_question(question_id: int, db: Session = Depends(get_db)) -> models.Question:
+@cache_response('questions', schemas.Question)
+def get_question(
+        question_id: int,
+        etag: Optional[str] = Depends(conditional_get(models.Question, 'question_id')),
+        db: Session = Depends(get_db)
+) -> models.Question:
     """Gets `Question` object by `question_key`.
 
     Args:
         `question_id` (int): `Question` object's id.
+        `etag` (Optional[str], optional): Current ETag of the question, part of the response cache key.
         `db` (Session, optional): Database connection.
 
     Returns:
@@ -104,6 +114,11 @@ def get_question(question_id: int, db: Session = Depends(get_db)) -> models.Ques
     return crud.get_object(cls=models.Question, db=db, object_id=question_id)
 
 
+@router.get('/{question_title}/title/', response_model=list[schemas.Question])
+def get_questions_by_title(question_title: str, db: Session = Depends(get_db)) -> list[models.Question]:
+    return crud.get_questions_by_title(db=db, title=question_title)
+
+
 @router.get('/{user_id}/user/', response_model=list[schemas.Question])
 def get_questions_by_user(user_id: int, db: Session = Depends(get_db)) -> list[models.Question]:
     """Returns a list of user's questions by `user_id`.
@@ -141,32 +156,31 @@ def update_question(
         `models.Question`: `Question` object.
     """
 
-    if current_user.role.title != 'Admin' and \
-            current_user.id != crud.get_object(cls=models.Question, db=db, object_id=question_id).author.id:
+    if not current_user.is_admin and \
+            current_user.id != crud.get_object(cls=models.Question, db=db, object_id=question_id).author_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail='You did not give the views parameter.'
         )
 
-    return crud.update_question(db=db, question_id=question_id, question=question)
+    question_db = crud.update_question(db=db, question_id=question_id, question=question)
+    invalidate_cache('questions', 'tags')
+    return question_db
 
 
-@router.patch('/{question_id}/views/')
-def update_question_views(question_id: int, views: int, db: Session = Depends(get_db)) -> models.Question:
-    """Updates question views by a given `question_id`.
+@router.patch('/{question_id}/views/', response_model=schemas.Question)
+def update_question_views(question_id: int, db: Session = Depends(get_db)) -> models.Question:
+    """Increments views of a question by a given `question_id`.
 
     Args:
-        `question_id` (int):
-        `views` (int):
+        `question_id` (int): `Question` object's id.
         `db` (Session, optional): Database connection.
 
     Returns:
         `models.Question`: `Question` object.
     """
 
-    return crud.update_question(
-        db=db, question_id=question_id, question=schemas.QuestionUpdate(views=views)
-    )
+    return crud.increment_views(db=db, question_id=question_id)
 
 
 @router.delete('/{question_id}/')
@@ -188,12 +202,17 @@ def delete_question(
         `Response`: No content response.
     """
 
-    if current_user.role.title != 'Admin' and\
-            current_user.id != crud.get_object(cls=models.Question, db=db, object_id=question_id).author.id:
+    if not crud.delete_if_owner(
+            cls=models.Question,
+            db=db,
+            object_id=question_id,
+            user_id=current_user.id,
+            is_admin=current_user.is_admin
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail='You are not the owner of the question.'
         )
 
-    crud.delete_object(cls=models.Question, db=db, object_id=question_id)
+    invalidate_cache('questions', 'tags')
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,10 +1,10 @@
-from typing import Union
 from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.session import Session
 
 from database import crud, models, schemas
 from dependencies import get_db, get_current_user
-from decorators import raise_403_if_not_admin
+from decorators import cache_response, invalidate_cache, raise_403_if_not_admin
 
 router = APIRouter(prefix='/tags', tags=['tags'])
 
@@ -26,10 +26,13 @@ def create_tag(
         `models.Tag`: `Tag` object.
     """
 
-    return crud.create_tag(db=db, tag=tag)
+    tag_db = crud.create_tag(db=db, tag=tag)
+    invalidate_cache('tags')
+    return tag_db
 
 
 @router.get('/', response_model=list[schemas.Tag])
+@cache_response('tags', list[schemas.Tag])
 def get_tags(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)) -> list[models.Tag]:
     """Gets all `Tags` from database in range [`skip`:`skip+limit`] and returns them to the client.
 
@@ -42,24 +45,47 @@ def get_tags(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)) ->
         `list[models.Tag]`: A `list` of all `Tag` objects.
     """
 
-    return crud.get_objects(cls=models.Tag, db=db, skip=skip, limit=limit)
+    return crud.get_objects(
+        cls=models.Tag,
+        db=db,
+        skip=skip,
+        limit=limit,
+        options=(selectinload(models.Tag.questions).selectinload(models.Question.tags),)
+    )
 
 
-@router.get('/{tag_key}/', response_model=schemas.Tag)
-def get_tag(tag_key: Union[int, str], db: Session = Depends(get_db)) -> models.Tag:
-    """Gets `Tag` object by `tag_key`.
+@router.get('/{tag_id:int}/', response_model=schemas.Tag)
+@cache_response('tags', schemas.Tag)
+def get_tag_by_id(tag_id: int, db: Session = Depends(get_db)) -> models.Tag:
+    """Gets `Tag` object by `tag_id`.
 
     Args:
-        `tag_key` (Union[int, str]): `Tag` object's id or title.
+        `tag_id` (int): `Tag` object's id.
+        `db` (Session, optional): Database connection.
+
+    Returns:
+        `models.Tag`: `Tag` object.
+    """
+
+    return crud.get_object(cls=models.Tag, db=db, object_id=tag_id)
+
+
+@router.get('/{tag_title}/', response_model=schemas.Tag)
+@cache_response('tags', schemas.Tag)
+def get_tag(tag_title: str, db: Session = Depends(get_db)) -> models.Tag:
+    """Gets `Tag` object by `tag_title`.
+
+    Args:
+        `tag_title` (str): `Tag` object's title.
         `db` (Session, optional): Database connection.
 
     Returns:
         `models.Tag`: `Tag` object.
     """
 
-    if isinstance(tag_key, int):
-        return crud.get_object(cls=models.Tag, db=db, object_id=tag_key)
-    return crud.get_object_by_expression(cls=models.Tag, db=db, expression=(models.Tag.title == tag_key), raise_404=True)
+    return crud.get_object_by_expression(
+        cls=models.Tag, db=db, expression=(models.Tag.title == tag_title), raise_404=True
+    )
 
 
 @router.patch('/{tag_id}/', response_model=schemas.Tag)
@@ -81,7 +107,9 @@ def update_tag(
         `models.Tag`: `Tag` object.
     """
 
-    return crud.update_tag(db=db, tag_id=tag_id, tag=tag)
+    tag_db = crud.update_tag(db=db, tag_id=tag_id, tag=tag)
+    invalidate_cache('tags', 'questions')
+    return tag_db
 
 
 @router.delete('/{tag_id}/')
@@ -101,5 +129,6 @@ def delete_tag(
         `Response`: No content response.
     """
 
-    crud.delete_object(cls=models.Tag, db=db, object_id=tag_id)
+    crud.delete_tag(db=db, tag_id=tag_id)
+    invalidate_cache('tags', 'questions')
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, Response, status, HTTPException
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.session import Session
 
 from database import crud, models, schemas
-from decorators import raise_403_if_not_admin
+from decorators import cache_response, invalidate_cache, raise_403_if_not_admin
 from dependencies import get_db, get_current_user
 
 router = APIRouter(prefix='/articles', tags=['articles'])
@@ -25,10 +26,13 @@ def create_article(
         `models.Article`: `Article` object.
     """
 
-    return crud.create_article(db=db, article=article)
+    article_db = crud.create_article(db=db, article=article)
+    invalidate_cache('articles')
+    return article_db
 
 
 @router.get('/', response_model=list[schemas.Article])
+@cache_response('articles', list[schemas.Article])
 def get_articles(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)) -> list[models.Article]:
     """Gets all `Articles` from database in range [`skip`:`skip+limit`] and returns them to the client.
 
@@ -45,11 +49,16 @@ def get_articles(skip: int = 0, limit: int = 100, db: Session = Depends(get_db))
         cls=models.Article,
         db=db, skip=skip,
         limit=limit,
-        order_by=models.Article.date_created.desc()
+        order_by=models.Article.date_created.desc(),
+        options=(
+            selectinload(models.Article.likes).selectinload(models.User.role),
+            selectinload(models.Article.dislikes).selectinload(models.User.role),
+        )
     )
 
 
 @router.get('/{article_id}/', response_model=schemas.Article)
+@cache_response('articles', schemas.Article)
 def get_article(article_id: int, db: Session = Depends(get_db)) -> models.Article:
     """Gets `Article` object by `article_id`.
 
@@ -82,8 +91,10 @@ def update_article(
         `models.Article`: `Article` object.
     """
 
-    if current_user.role.title == 'Admin':
-        return crud.update_object(cls=models.Article, db=db, object_id=article_id, schema_object=article)
+    if current_user.is_admin:
+        article_db = crud.update_object(cls=models.Article, db=db, object_id=article_id, schema_object=article)
+        invalidate_cache('articles')
+        return article_db
 
     raise HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
@@ -110,7 +121,9 @@ def update_article_rating(
         `models.Article`: `Article` object.
     """
 
-    return crud.update_article_rating(db=db, article_id=article_id, user=current_user, rating_type=rating_type)
+    article_db = crud.update_article_rating(db=db, article_id=article_id, user=current_user, rating_type=rating_type)
+    invalidate_cache('articles')
+    return article_db
 
 
 @router.delete('/{article_id}/')
@@ -131,4 +144,5 @@ def delete_article(
     """
 
     crud.delete_object(cls=models.Article, db=db, object_id=article_id)
+    invalidate_cache('articles')
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,11 +1,12 @@
 from typing import Optional
 from fastapi import APIRouter, Depends, status, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.orm import Session
 
 from database import crud, schemas, models
 from dependencies import get_db, get_current_user
 from decorators import raise_403_if_not_admin, raise_403_if_no_access
+from services import decode_cursor, set_next_cursor
 
 
 router = APIRouter(prefix='/notifications', tags=['notifications'])
@@ -16,21 +17,39 @@ router = APIRouter(prefix='/notifications', tags=['notifications'])
 def get_notifications(
         skip: Optional[int] = 0,
         limit: Optional[int] = 100,
+        after: Optional[str] = None,
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
-) -> list[models.Notification]:
-    """Gets all `Notifications` from database in range [`skip`:`skip+limit`] and returns them to the client.
+) -> list[models.Notification] | ORJSONResponse:
+    """Gets a page of `Notifications` ordered by id and returns them to the client.
+
+    Pages are walked with the `after` cursor taken from the `X-Next-Cursor` header of the previous page.
+    `skip` is kept for older clients and only used without a cursor. Cursor pages are selected
+    as plain rows and sent without building ORM objects or validating them again.
 
     Args:
-        `skip` (Optional[int], optional): How many objects to skip. Defaults to 0.
+        `skip` (Optional[int], optional): How many objects to skip. Deprecated. Defaults to 0.
         `limit` (Optional[int], optional): Maximum amount of objects. Defaults to 100.
+        `after` (Optional[str], optional): Cursor of the previous page. Defaults to None.
         `db` (Session, optional): Database connection.
 
     Returns:
-        list[models.Notification]: A `list` of all `Notification` objects.
+        list[models.Notification] | ORJSONResponse: A `list` of `Notification` objects.
     """
 
-    return crud.get_objects(cls=models.Notification, db=db, skip=skip, limit=limit)
+    if after is None and skip:
+        return crud.get_objects(cls=models.Notification, db=db, skip=skip, limit=limit)
+
+    notifications = crud.get_objects_after(
+        cls=models.Notification,
+        db=db,
+        after=decode_cursor(after) if after is not None else None,
+        limit=limit,
+        columns=crud.NOTIFICATION_COLUMNS
+    )
+    response = ORJSONResponse(content=notifications)
+    set_next_cursor(response=response, objects=notifications, limit=limit)
+    return response
 
 
 @router.post('/', response_model=schemas.Notification)
@@ -59,22 +78,37 @@ def get_user_notifications(
         user_id: int,
         skip: int = 0,
         limit: int = 100,
+        after: Optional[str] = None,
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
-) -> list[models.Notification]:
-    """Gets notifications by a given `user_id` in range[`skip`:`skip+limit`] and returns them to the client.
+) -> ORJSONResponse:
+    """Gets a page of notifications by a given `user_id`, newest first, and returns them to the client.
+
+    Notifications are selected as plain rows and sent without building ORM objects or validating them again.
 
     Args:
         `user_id` (int): `User` object id.
-        `skip` (int, optional): How many objects to skip. Defaults to 0.
+        `skip` (int, optional): How many objects to skip. Deprecated. Defaults to 0.
         `limit` (int, optional): Maximum amount of objects. Defaults to 100.
+        `after` (Optional[str], optional): Cursor of the previous page. Defaults to None.
         `db` (Session, optional): Database connection.
 
     Returns:
-        `list[models.Notification]`: A list of `Notification` objects.
+        `ORJSONResponse`: A list of `Notification` objects.
     """
-    
-    return crud.get_notifications_by_user_id(db=db, user_id=user_id, skip=skip, limit=limit)
+
+    notifications = crud.get_notifications_by_user_id(
+        db=db,
+        user_id=user_id,
+        skip=skip,
+        limit=limit,
+        after=decode_cursor(after) if after is not None else None,
+        check_user=(user_id != current_user.id)
+    )
+    response = ORJSONResponse(content=notifications)
+    if after is not None or not skip:
+        set_next_cursor(response=response, objects=notifications, limit=limit)
+    return response
 
 
 @router.delete('/{notification_id}/')
@@ -93,14 +127,19 @@ def delete_notification(
         `Response`: No content response.
     """
 
-    notification = crud.get_object(cls=models.Notification, db=db, object_id=notification_id)
-    if notification.user_id != current_user.id and current_user.role.title != 'Admin':
+    if not crud.delete_if_owner(
+            cls=models.Notification,
+            db=db,
+            object_id=notification_id,
+            user_id=current_user.id,
+            is_admin=current_user.is_admin,
+            owner_column='user_id'
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail='You are not that user.'
         )
 
-    crud.delete_object(cls=models.Notification, db=db, object_id=notification_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -1,11 +1,12 @@
-from typing import Optional, Union
-from fastapi import APIRouter, Depends, status, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, Request, status, HTTPException
 from fastapi.responses import Response
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from database import crud, schemas, models
-from dependencies import get_db, get_current_user
+from dependencies import get_db, get_current_user, invalidate_user_cache, json_response_with_etag
 from decorators import raise_403_if_not_admin
+from services import decode_cursor, set_next_cursor
 
 
 router = APIRouter(prefix='/roles', tags=['roles'])
@@ -35,37 +36,59 @@ def create_role(
 @router.get('/', response_model=list[schemas.Role])
 @raise_403_if_not_admin
 def get_roles(
+        response: Response,
         skip: Optional[int] = 0,
         limit: Optional[int] = 100,
+        after: Optional[str] = None,
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ) -> list[models.Role]:
-    """Gets all `Roles` from database in range [`skip`:`skip+limit`] and returns them to the client.
+    """Gets a page of `Roles` ordered by id and returns them to the client.
+
+    Pages are walked with the `after` cursor taken from the `X-Next-Cursor` header of the previous page.
+    `skip` is kept for older clients and only used without a cursor.
 
     Args:
-        `skip` (Optional[int], optional): How many objects to skip. Defaults to 0.
+        `response` (Response): Response to set the next cursor on.
+        `skip` (Optional[int], optional): How many objects to skip. Deprecated. Defaults to 0.
         `limit` (Optional[int], optional): Maximum amount of objects. Defaults to 100.
+        `after` (Optional[str], optional): Cursor of the previous page. Defaults to None.
         `db` (Session, optional): Database connection.
         `current_user` (schemas.User, optional): A `schemas.User` object of current user.
 
     Returns:
-        `list[models.Role]`: A `list` of all `Role` objects.
+        `list[models.Role]`: A `list` of `Role` objects.
     """
 
-    return crud.get_objects(cls=models.Role, db=db, skip=skip, limit=limit)
+    options = (selectinload(models.Role.users),)
+    if after is None and skip:
+        return crud.get_objects(cls=models.Role, db=db, skip=skip, limit=limit, options=options)
+
+    roles = crud.get_objects_after(
+        cls=models.Role,
+        db=db,
+        after=decode_cursor(after) if after is not None else None,
+        limit=limit,
+        options=options
+    )
+    set_next_cursor(response=response, objects=roles, limit=limit)
+    return roles
 
 
 @router.get('/{role_key}/', response_model=schemas.Role)
 @raise_403_if_not_admin
 def get_role(
-        role_key: Union[int, str],
+        role_key: str,
+        request: Request,
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
-) -> models.Role:
-    """Gets a `Role` object from the database by `role_key` and returns it to the client.
+) -> Response:
+    """Gets a `Role` object from the database by `role_key` and returns it to the client,
+    or `304 Not Modified` if the client already has it.
 
     Args:
         `role_key` (int): A `Role` object id or title.
+        `request` (Request): Incoming request.
         `db` (Session, optional): Database connection.
         `current_user` (schemas.User, optional): A `schemas.User` object of current user.
 
@@ -73,28 +96,26 @@ def get_role(
         `HTTPException`: If an invalid `role_key` was given.
 
     Returns:
-        `models.Role`: A new `Role` object.
+        `Response`: A `Role` object.
     """
 
-    if isinstance(role_key, int):
-        return crud.get_object(cls=models.Role, db=db, object_id=role_key)
-    if role_key.isalpha():
-        return crud.get_object_by_expression(
-            cls=models.Role,
-            db=db,
-            expression=(models.Role.title == role_key),
-            raise_404=True
+    if role_key.isascii() and role_key.isdigit():
+        role = crud.get_object(cls=models.Role, db=db, object_id=int(role_key))
+    elif role_key.isalpha():
+        role = crud.get_object(cls=models.Role, db=db, object_id=crud.get_role_id_by_title(db=db, title=role_key))
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Unresolved type of role_key.'
         )
-    raise HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        detail='Unresolved type of role_key.'
-    )
+
+    return json_response_with_etag(request=request, body=schemas.Role.model_validate(role).model_dump_json())
 
 
 @router.patch('/{role_key}/', response_model=schemas.Role)
 @raise_403_if_not_admin
 def update_role(
-        role_key: Union[int, str],
+        role_key: str,
         role: schemas.RoleUpdate,
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
@@ -114,20 +135,24 @@ def update_role(
         `schemas.Role`: Updated `Role` object.
     """
 
-    if isinstance(role_key, int):
-        return crud.update_role(db=db, role_id=role_key, role=role)
+    if role_key.isascii() and role_key.isdigit():
+        role_db = crud.update_role(db=db, role_id=int(role_key), role=role)
     elif role_key.isalpha():
-        return crud.update_role_by_title(db=db, role_title=role_key, role=role)
-    raise HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        detail='Unresolved role_key.'
-    )
+        role_db = crud.update_role_by_title(db=db, role_title=role_key, role=role)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Unresolved role_key.'
+        )
+
+    invalidate_user_cache()
+    return role_db
 
 
 @router.delete('/{role_key}/')
 @raise_403_if_not_admin
 def delete_role(
-        role_key: Union[int, str],
+        role_key: str,
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ) -> Response:
@@ -145,8 +170,8 @@ def delete_role(
         `Response`: No content response.
     """
 
-    if isinstance(role_key, int):
-        crud.delete_object(cls=models.Role, db=db, object_id=role_key)
+    if role_key.isascii() and role_key.isdigit():
+        crud.delete_role(db=db, role_id=int(role_key))
     elif role_key.isalpha():
         crud.delete_role_by_title(db=db, title=role_key)
     else:
@@ -155,4 +180,5 @@ def delete_role(
             detail='Unresolved role_key.'
         )
 
+    invalidate_user_cache()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,13 +1,14 @@
-from typing import Optional, Union
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Request, status
 from fastapi.exceptions import HTTPException
 from fastapi.responses import Response
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from database import crud, schemas, models
-from dependencies import get_current_user, get_db
+from dependencies import get_current_user, get_db, invalidate_user_cache, json_response_with_etag
 from decorators import raise_403_if_not_admin, raise_403_if_no_access
-from services import isemail
+from security.oauth2 import forget_failed_logins
+from services import decode_cursor, isemail, set_next_cursor
 
 router = APIRouter(prefix='/users', tags=['users'])
 
@@ -24,41 +25,71 @@ def create_user(user: schemas.UserCreate, db: Session = Depends(get_db)) -> mode
         `models.User`: A new `User` object.
     """
 
-    return crud.create_user(db=db, user=user)
+    user_db = crud.create_user(db=db, user=user)
+    forget_failed_logins(user_db.username, user_db.email)
+    return user_db
 
 
 @router.get('/', response_model=list[schemas.User])
-def get_users(skip: Optional[int] = 0, limit: Optional[int] = 100, db: Session = Depends(get_db)) -> list[models.User]:
-    """Gets all `Users` from database in range [`skip`:`skip+limit`] and returns them to the client.
+def get_users(
+        response: Response,
+        skip: Optional[int] = 0,
+        limit: Optional[int] = 100,
+        after: Optional[str] = None,
+        db: Session = Depends(get_db)
+) -> list[models.User]:
+    """Gets a page of `Users` ordered by id and returns them to the client.
+
+    Pages are walked with the `after` cursor taken from the `X-Next-Cursor` header of the previous page.
+    `skip` is kept for older clients and only used without a cursor.
 
     Args:
-        `skip` (Optional[int], optional): How many objects to skip. Defaults to 0.
+        `response` (Response): Response to set the next cursor on.
+        `skip` (Optional[int], optional): How many objects to skip. Deprecated. Defaults to 0.
         `limit` (Optional[int], optional): Maximum amount of objects. Defaults to 100.
+        `after` (Optional[str], optional): Cursor of the previous page. Defaults to None.
         `db` (Session, optional): Database connection.
 
     Returns:
-        `list[models.User]`: A `list` of all `User` objects.
+        `list[models.User]`: A `list` of `User` objects.
     """
 
-    return crud.get_objects(cls=models.User, db=db, skip=skip, limit=limit)
+    options = (selectinload(models.User.role),)
+    if after is None and skip:
+        return crud.get_objects(cls=models.User, db=db, skip=skip, limit=limit, options=options)
+
+    users = crud.get_objects_after(
+        cls=models.User,
+        db=db,
+        after=decode_cursor(after) if after is not None else None,
+        limit=limit,
+        options=options
+    )
+    set_next_cursor(response=response, objects=users, limit=limit)
+    return users
 
 
 @router.get("/me/", response_model=schemas.User)
-def read_users_me(current_user: schemas.User = Depends(get_current_user)) -> models.User:
-    """Returns a `current_user`.
+def read_users_me(request: Request, current_user: schemas.User = Depends(get_current_user)) -> Response:
+    """Returns a `current_user`, or `304 Not Modified` if the client already has it.
 
     Args:
+        `request` (Request): Incoming request.
         `current_user` (schemas.User, optional): A `schemas.User` object of current user.
 
     Returns:
-        `models.User`: A `schemas.User` object of current user.
+        `Response`: A `schemas.User` object of current user.
     """
 
-    return current_user
+    return json_response_with_etag(
+        request=request,
+        body=current_user.model_dump_json(include=set(schemas.User.model_fields)),
+        cache_control='private, max-age=30'
+    )
 
 
 @router.get('/{user_key}/', response_model=schemas.User)
-def get_user(user_key: Union[int, str], db: Session = Depends(get_db)) -> models.User:
+def get_user(user_key: str, db: Session = Depends(get_db)) -> models.User:
     """Gets a `User` object from the database by `role_key` and returns it to the client.
 
     Args:
@@ -72,8 +103,8 @@ def get_user(user_key: Union[int, str], db: Session = Depends(get_db)) -> models
         `models.User`: A new `User` object.
     """
 
-    if isinstance(user_key, int):
-        return crud.get_object(cls=models.User, db=db, object_id=user_key)
+    if user_key.isascii() and user_key.isdigit():
+        return crud.get_object(cls=models.User, db=db, object_id=int(user_key))
     elif isemail(user_key):
         return crud.get_object_by_expression(
             cls=models.User,
@@ -112,6 +143,7 @@ def delete_user(
     """
 
     crud.delete_object(cls=models.User, db=db, object_id=user_id)
+    invalidate_user_cache(user_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -135,4 +167,9 @@ def update_user(
         `models.User`: Updated `User` object.
     """
 
-    return crud.update_user(db=db, user_id=user_id, user=user)
+    password_changed = user.password is not None
+    user_db = crud.update_user(db=db, user_id=user_id, user=user)
+    invalidate_user_cache(user_id)
+    if password_changed:
+        forget_failed_logins(user_db.username, user_db.email)
+    return user_db
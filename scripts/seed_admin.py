@@ -0,0 +1,30 @@
+from database import models
+from database.db import SessionLocal
+from security.hashing import get_password_hash
+
+
+def seed() -> None:
+    """Creates the default roles and the `admin` user if they don't exist yet."""
+
+    with SessionLocal() as db:
+        if not db.query(db.query(models.Role).exists()).scalar():
+            a = models.Role(title='Admin')
+            u = models.Role(title='User')
+            db.add_all([a, u])
+
+        if not db.query(db.query(models.User).filter_by(username='admin').exists()).scalar():
+            admin_email = 'admin@observers.com'
+            admin_password = get_password_hash('admin')
+            admin = models.User(
+                username='admin',
+                email=admin_email,
+                password=admin_password,
+                role_id=1
+            )
+            db.add(admin)
+
+        db.commit()
+
+
+if __name__ == '__main__':
+    seed()
@@ -1,20 +1,64 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from argon2.exceptions import InvalidHash, VerificationError
+from argon2.low_level import Type, verify_secret
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+ARGON2_MEMORY_COST = int(os.environ.get('ARGON2_MEMORY_COST', 19456))
+ARGON2_TIME_COST = int(os.environ.get('ARGON2_TIME_COST', 2))
+ARGON2_PARALLELISM = int(os.environ.get('ARGON2_PARALLELISM', 1))
+
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=ARGON2_MEMORY_COST,
+    argon2__time_cost=ARGON2_TIME_COST,
+    argon2__parallelism=ARGON2_PARALLELISM,
+)
+
+HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix='password-hash')
+
+_CURRENT_ARGON2_PREFIX = f'$argon2id$v=19$m={ARGON2_MEMORY_COST},t={ARGON2_TIME_COST},p={ARGON2_PARALLELISM}$'
+
+
+def _verify_and_update(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    # Hashes made with the current settings never need an update, so they are
+    # checked by argon2 directly instead of going through passlib's dispatch.
+    if hashed_password.startswith(_CURRENT_ARGON2_PREFIX):
+        try:
+            return verify_secret(hashed_password.encode(), plain_password.encode(), Type.ID), None
+        except (VerificationError, InvalidHash):
+            return False, None
+    return pwd_context.verify_and_update(plain_password, hashed_password)
 
 
-async def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Checks if the given `password` is correct.
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Checks if the given `password` is correct and rehashes it if `hashed_password` uses outdated settings.
 
     Args:
         `plain_password` (str): A given `password`.
         `hashed_password` (str): A hashed `password` form database.
 
     Returns:
-        `bool`: True if the `password` is correct, otherwise `False`.
+        `tuple[bool, str | None]`: True if the `password` is correct, and a new hash if it should be replaced.
+    """
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(HASH_POOL, _verify_and_update, plain_password, hashed_password)
+
+
+async def dummy_verify_password() -> None:
+    """Spends as much time as `verify_and_update_password` does, so a missing user takes as long as a wrong password.
+
+    Returns:
+        `None`
     """
 
-    return pwd_context.verify(plain_password, hashed_password)
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(HASH_POOL, pwd_context.dummy_verify)
 
 
 def get_password_hash(password: str) -> str:
@@ -27,4 +71,4 @@ def get_password_hash(password: str) -> str:
         `str`: A hashed `password` as a string.
     """
 
-    return pwd_context.hash(password)
+    return HASH_POOL.submit(pwd_context.hash, password).result()
@@ -1,3 +1,8 @@
+import hashlib
+import threading
+
+from cachetools import TTLCache
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from database import models
@@ -6,20 +11,57 @@ from . import hashing
 
 from services import get_user_by_username_or_email
 
+_failed_logins = TTLCache(maxsize=10000, ttl=30)
+_failed_logins_lock = threading.Lock()
+
+
+def forget_failed_logins(*logins: str) -> None:
+    """Drops remembered failed attempts for `logins`, e.g. after the user's password was changed.
+
+    Args:
+        `logins` (str): Usernames or emails the attempts were made with.
+
+    Returns:
+        `None`
+    """
+
+    with _failed_logins_lock:
+        for key in [key for key in _failed_logins if key[0] in logins]:
+            _failed_logins.pop(key, None)
+
+
+def _save_password_hash(db: Session, user: models.User, password_hash: str) -> None:
+    user.password = password_hash
+    db.commit()
+
 
 async def authenticate_user(db: Session, username: str, password: str) -> models.User | bool:
     """Returns a user with `username` and `password` if exists, otherwise returns `False`.
 
+    Failed `username` and `password` pairs are remembered for a short time, so repeated
+    attempts are rejected without hashing the password again. Passwords stored with
+    bcrypt or outdated argon2 settings are rehashed on a successful login.
+
     Returns:
         `models.User` | `bool`: `models.User` object if exists, otherwise `False`.
     """
 
-    user = get_user_by_username_or_email(db=db, username=username)
+    key = (username, hashlib.blake2b(password.encode(), digest_size=16).digest())
+    with _failed_logins_lock:
+        if key in _failed_logins:
+            return False
+
+    user = await run_in_threadpool(get_user_by_username_or_email, db=db, username=username)
     if not user:
+        await hashing.dummy_verify_password()
+        with _failed_logins_lock:
+            _failed_logins[key] = True
         return False
-    if not await hashing.verify_password(password, user.password):
+    verified, new_hash = await hashing.verify_and_update_password(password, user.password)
+    if not verified:
+        with _failed_logins_lock:
+            _failed_logins[key] = True
         return False
+    if new_hash:
+        await run_in_threadpool(_save_password_hash, db, user, new_hash)
     return user
-
-
-
@@ -1,5 +1,3 @@
-from datetime import timedelta
-
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
@@ -34,8 +32,8 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token_expires = timedelta(minutes=security_token.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = security_token.create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
+        data={"sub": user.username, "uid": user.id},
+        expires_delta=security_token.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     )
     return {"access_token": access_token, "token_type": "bearer"}
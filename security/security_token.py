@@ -1,11 +1,14 @@
+import base64
+import hashlib
+import hmac
 import os
 import secrets
-from datetime import datetime, timedelta
+import time
 from typing import Optional
 from dotenv import load_dotenv
 
+import orjson
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt
 
 load_dotenv()
 SECRET_KEY = os.environ.get('SECRET_KEY') or secrets.token_hex(64)
@@ -14,23 +17,24 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/token")
 
+_SECRET_KEY_BYTES = SECRET_KEY.encode()
+_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b'=')
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+
+def create_access_token(data: dict, expires_delta: Optional[int] = None) -> str:
     """Creates access token with a given `data` and `expires_delta`.
 
     Args:
         `data` (dict): A `dict` where exists a key "sub" with value of username.
-        `expires_delta` (Optional[timedelta], optional): Time of token expiration. Defaults to None.
+        `expires_delta` (Optional[int], optional): Token lifetime in seconds. Defaults to None, which means 15 minutes.
 
     Returns:
         `str`: A Json Web Token.
     """
 
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    to_encode["exp"] = int(time.time()) + (expires_delta or 900)
+
+    signing_input = _HEADER_B64 + b'.' + base64.urlsafe_b64encode(orjson.dumps(to_encode)).rstrip(b'=')
+    signature = hmac.new(_SECRET_KEY_BYTES, signing_input, hashlib.sha256).digest()
+    return (signing_input + b'.' + base64.urlsafe_b64encode(signature).rstrip(b'=')).decode()
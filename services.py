@@ -1,22 +1,127 @@
-import re
+import base64
+import binascii
+from typing import Iterable, Iterator, Sequence
 
-from sqlalchemy.orm import Session
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from database.crud import get_object_by_expression
 from database import models
 
+_AUTH_USER_OPTIONS = (joinedload(models.User.role), raiseload('*'))
 
-def isemail(email: str):
-    return re.fullmatch(r'^([A-Za-z0-9]+[.-_])*[A-Za-z0-9]+@[A-Za-z0-9-]+(\.[A-Z|a-z]{2,})+$', email)
+
+def isemail(email: str) -> bool:
+    """Tells whether `email` looks like an email rather than a username.
+
+    Only used to pick the column a user is looked up by, so it doesn't validate
+    the address. Emails are validated by `schemas.UserBase` on the way in.
+
+    Args:
+        `email` (str): Username or email.
+
+    Returns:
+        `bool`: True if `email` has a local part and a dotted domain.
+    """
+
+    at = email.rfind('@')
+    return at > 0 and '.' in email[at + 1:] and ' ' not in email
 
 
 def get_user_by_username_or_email(db: Session, username: str) -> models.User | None:
     """Returns a `User` object if `username` equals User's username or email. Otherwise `None`.
 
+    The user's role is loaded in the same query and any other relationship raises on access.
+
     Returns:
         `models.User | None`: A `User` object if `username` equals User's username or email. Otherwise `None`.
     """
 
-    return get_object_by_expression(cls=models.User, db=db, expression=(models.User.email == username)) \
-        if isemail(username) \
-        else get_object_by_expression(cls=models.User, db=db, expression=(models.User.username == username))
+    return get_object_by_expression(
+        cls=models.User,
+        db=db,
+        expression=(models.User.email == username) if isemail(username) else (models.User.username == username),
+        options=_AUTH_USER_OPTIONS
+    )
+
+
+def get_user_by_id(db: Session, user_id: int) -> models.User | None:
+    """Returns a `User` object by its primary key with the same loading as `get_user_by_username_or_email`.
+
+    Returns:
+        `models.User | None`: A `User` object if exists. Otherwise `None`.
+    """
+
+    return db.get(models.User, user_id, options=_AUTH_USER_OPTIONS)
+
+
+def stream_json_list(objects: Iterable, schema: type[BaseModel]) -> Iterator[str]:
+    """Serializes `objects` with `schema` into a JSON array one object at a time.
+
+    Args:
+        `objects` (Iterable): ORM objects to serialize.
+        `schema` (type[BaseModel]): Pydantic schema of a single object.
+
+    Yields:
+        `Iterator[str]`: Chunks of the JSON array.
+    """
+
+    yield '['
+    for i, obj in enumerate(objects):
+        if i:
+            yield ','
+        yield schema.model_validate(obj).model_dump_json()
+    yield ']'
+
+
+def encode_cursor(object_id: int) -> str:
+    """Encodes `object_id` into an opaque pagination cursor.
+
+    Args:
+        `object_id` (int): Id of the last object on a page.
+
+    Returns:
+        `str`: URL-safe cursor.
+    """
+
+    return base64.urlsafe_b64encode(str(object_id).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decodes a pagination `cursor` made by `encode_cursor`.
+
+    Args:
+        `cursor` (str): URL-safe cursor.
+
+    Raises:
+        `HTTPException`: If `cursor` is malformed.
+
+    Returns:
+        `int`: Id of the last object on the previous page.
+    """
+
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Invalid cursor.'
+        )
+
+
+def set_next_cursor(response: Response, objects: Sequence, limit: int) -> None:
+    """Sets the `X-Next-Cursor` header if there may be more objects after a full page.
+
+    Args:
+        `response` (Response): Response to set the header on.
+        `objects` (Sequence): Objects or `dict` rows of the current page, ordered by id.
+        `limit` (int): Page size.
+
+    Returns:
+        `None`
+    """
+
+    if objects and len(objects) == limit:
+        last = objects[-1]
+        response.headers['X-Next-Cursor'] = encode_cursor(last['id'] if isinstance(last, dict) else last.id)